@@ -2,171 +2,482 @@
 """
 End-to-End Test Runner for ledit
 Tests complete user workflows with real AI models
+
+The same runner drives the integration suite (see integration_test_runner.py);
+each suite is described by a Suite and passed to main().
 """
 
 import os
 import sys
+import io
+import shutil
+import contextlib
+import signal
+import tempfile
+import threading
+import time
 import subprocess
 import argparse
+import asyncio
 import json
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 TEST_DIR = "e2e_tests"
+TEST_TIMEOUT = 600  # 10 minute timeout for e2e tests
+LOG_TAIL_LINES = 200
+# Tests must not depend on the user's interactive shell setup, so skip rc files
+BASH = ("bash", "--noprofile", "--norc")
+DEFAULT_E2E_MODEL = "openrouter:qwen/qwen3-coder-30b-a3b-instruct"
+
+@dataclass(frozen=True)
+class Suite:
+    """Settings that differ between the test suites sharing this runner"""
+    name: str  # short label used in messages, e.g. "e2e"
+    description: str
+    test_dir: str
+    default_model: str
+    list_header: str
+    test_timeout: int = TEST_TIMEOUT
+    single_test_timeout: int = 0  # timeout for a -t N run; 0 means test_timeout
+    build_tags: tuple = ()
+    require_real_model: bool = False  # reject the test:test model
+    confirm: bool = False  # ask before running the whole suite
+    non_interactive_tests: frozenset = frozenset()  # whitelist for --non-interactive
+
+E2E_SUITE = Suite(
+    name="e2e",
+    description="Run ledit end-to-end tests with real AI models",
+    test_dir=TEST_DIR,
+    default_model=DEFAULT_E2E_MODEL,
+    list_header="Available end-to-end tests (require real AI models):",
+    require_real_model=True,
+    confirm=True,
+    non_interactive_tests=frozenset({"test_ui_smoke.sh"}),
+)
 
-def main():
-    parser = argparse.ArgumentParser(description="Run ledit end-to-end tests with real AI models")
+def main(suite=E2E_SUITE):
+    parser = argparse.ArgumentParser(description=suite.description)
     parser.add_argument("-t", "--test", type=int, help="Run specific test by number")
     parser.add_argument("-l", "--list", action="store_true", help="List available tests")
-    parser.add_argument("-y", "--yes", action="store_true", help="Run all tests without confirmation")
+    if suite.confirm:
+        parser.add_argument("-y", "--yes", action="store_true", help="Run all tests without confirmation")
     parser.add_argument(
         "-m",
         "--model",
-        default="openrouter:qwen/qwen3-coder-30b-a3b-instruct",
-        help="Model to use (default: openrouter:qwen/qwen3-coder-30b-a3b-instruct)",
+        default=suite.default_model,
+        help=f"Model to use (default: {suite.default_model})",
     )
+    if suite.non_interactive_tests:
+        parser.add_argument(
+            "--non-interactive",
+            action="store_true",
+            help="Run only non-interactive, no-network smoke tests",
+        )
+    # Leave two cores of headroom for the rest of the machine
+    default_jobs = max(1, (os.cpu_count() or 2) - 2)
     parser.add_argument(
-        "--non-interactive",
+        "-j",
+        "--jobs",
+        type=int,
+        default=default_jobs,
+        help=f"Number of tests to run concurrently (default: {default_jobs})",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        help="Wall-clock budget in seconds for the whole run; unstarted tests are skipped once it passes",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
         action="store_true",
-        help="Run only non-interactive, no-network smoke tests",
+        help="Supervise tests from one asyncio event loop instead of a process pool",
     )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.deadline is not None and args.deadline <= 0:
+        parser.error("--deadline must be positive")
+
+    non_interactive = getattr(args, "non_interactive", False)
 
     # Validate model (basic sanity)
-    if args.model == "test:test":
-        print("ERROR: E2E tests require a real AI model, not test:test")
-        print("Tip: using default model: openrouter:qwen/qwen3-coder-30b-a3b-instruct")
-        args.model = "openrouter:qwen/qwen3-coder-30b-a3b-instruct"
+    if suite.require_real_model and args.model == "test:test":
+        print(f"ERROR: {suite.name.upper()} tests require a real AI model, not test:test")
+        print(f"Tip: using default model: {suite.default_model}")
+        args.model = suite.default_model
 
     # Find test directory
     script_dir = Path(__file__).parent
-    test_path = script_dir / TEST_DIR
+    test_path = script_dir / suite.test_dir
     
     if not test_path.exists():
-        print(f"Error: {TEST_DIR} directory not found")
+        print(f"Error: {suite.test_dir} directory not found")
         sys.exit(1)
 
     # Discover tests
-    tests = sorted([f for f in test_path.glob("*.sh") if f.is_file()])
-    if args.non_interactive:
+    # DirEntry.is_file() uses the d_type from the directory listing, avoiding a stat per entry
+    with os.scandir(test_path) as entries:
+        tests = sorted(
+            (Path(e.path) for e in entries if e.name.endswith(".sh") and e.is_file()),
+            key=lambda p: p.name,
+        )
+    if non_interactive:
         # Whitelist of non-interactive, no-network tests
-        ni_set = {"test_ui_smoke.sh"}
-        tests = [f for f in tests if f.name in ni_set]
+        tests = [f for f in tests if f.name in suite.non_interactive_tests]
     
     if args.list:
-        header = "Available non-interactive tests:" if args.non_interactive else "Available end-to-end tests (require real AI models):"
+        header = "Available non-interactive tests:" if non_interactive else suite.list_header
         print(header)
         for i, test in enumerate(tests, 1):
             print(f"{i}: {test.stem}")
         sys.exit(0)
 
     if not args.test:
-        print("Running ALL e2e tests with model:", args.model)
-        print("This may take a while and consume API credits!")
-        if not args.yes:
-            response = input("Continue? (y/N): ")
-            if response.lower() != 'y':
-                print("Aborted")
-                sys.exit(0)
+        print(f"Running ALL {suite.name} tests with model:", args.model)
+        if suite.confirm:
+            print("This may take a while and consume API credits!")
+        if suite.confirm and not args.yes:
+            if sys.stdin.isatty():
+                response = input("Continue? (y/N): ")
+                if response.lower() != 'y':
+                    print("Aborted")
+                    sys.exit(0)
+            else:
+                print("Non-interactive: stdin is not a TTY, assuming -y")
+        build_ledit(script_dir, suite.build_tags)
         # Run all tests
-        run_all_tests(script_dir, tests, args.model)
+        run_all_tests(script_dir, tests, args.model, jobs=args.jobs, deadline=args.deadline,
+                      suite=suite, use_async=args.use_async)
     else:
         # Run specific test
         if args.test < 1 or args.test > len(tests):
             print(f"Error: Test number must be between 1 and {len(tests)}")
             sys.exit(1)
         
+        build_ledit(script_dir, suite.build_tags)
         test_file = tests[args.test - 1]
-        print(f"\nRunning e2e test: {test_file.stem}")
+        print(f"\nRunning {suite.name} test: {test_file.stem}")
         print(f"Using model: {args.model}")
         print("-" * 50)
         
-        exit_code = run_single_test(script_dir, test_file, args.model)
+        exit_code = run_single_test(script_dir, test_file, args.model, stream=True,
+                                    timeout=suite.single_test_timeout or suite.test_timeout)
         sys.exit(exit_code)
 
-def run_single_test(script_dir, test_file, model):
-    """Run a single test and return exit code"""
-    # Build ledit if needed
-    build_result = subprocess.run(["go", "build", "-o", "ledit"], 
+def build_ledit(script_dir, tags=()):
+    """Build the ledit binary once per run.
+
+    The build always runs: go's own cache makes an unchanged tree a near no-op, and
+    it also tracks //go:embed inputs and build tags, which a hand-rolled staleness
+    check would miss.
+    """
+    ledit_bin = script_dir / "ledit"
+
+    # Fetch modules up front so a network/module problem is reported on its own
+    # and the build itself is pure compile + link
+    download_result = subprocess.run(["go", "mod", "download"],
+                                cwd=str(script_dir),
+                                capture_output=True, text=True)
+    if download_result.returncode != 0:
+        print(f"go mod download failed: {download_result.stderr}")
+        sys.exit(1)
+
+    print("Building ledit binary...")
+    build_cmd = ["go", "build"]
+    if tags:
+        build_cmd += ["-tags", ",".join(tags)]
+    build_result = subprocess.run(build_cmd + ["-o", "ledit"],
                                 cwd=str(script_dir),
                                 capture_output=True, text=True)
     if build_result.returncode != 0:
         print(f"Build failed: {build_result.stderr}")
-        return 1
-        
-    # Create temp directory for test
-    test_dir = script_dir / "testing" / test_file.stem
-    test_dir.mkdir(parents=True, exist_ok=True)
-    
+        sys.exit(1)
+    return ledit_bin
+
+def shm_dir():
+    """Return /dev/shm if it is a writable tmpfs mount, else None (system temp dir)"""
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK | os.X_OK):
+        return shm
+    return None
+
+def link_binary(src, dst):
+    """Expose src at dst without copying bytes: hard link, else symlink, else copy"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device (e.g. tmpfs workdir) or unsupported filesystem
+        try:
+            os.symlink(Path(src).resolve(), dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+def build_test_env(script_dir, jobs=1):
+    """Environment for test subprocesses: the current env with script_dir (the built ledit) on PATH.
+
+    With several tests running at once, each ledit (a Go program) is capped to
+    its share of the cores so concurrent tests don't oversubscribe the scheduler.
+    """
+    env = {**os.environ, "PATH": f"{script_dir}{os.pathsep}{os.environ.get('PATH', '')}"}
+    if jobs > 1 and "GOMAXPROCS" not in env:
+        env["GOMAXPROCS"] = str(max(1, (os.cpu_count() or 2) // jobs))
+    return env
+
+def _prepare_test_dir(script_dir, test_file):
+    """Create an isolated workdir for one test (on tmpfs when available) with ./ledit in it"""
+    test_dir = Path(tempfile.mkdtemp(prefix=f"ledit-{test_file.stem}-", dir=shm_dir()))
+
     # Ensure test-local binary exists (some scripts use ./ledit)
     built_bin = script_dir / "ledit"
     local_bin = test_dir / "ledit"
     try:
         if built_bin.exists():
-            import shutil
-            shutil.copy2(str(built_bin), str(local_bin))
+            link_binary(built_bin, local_bin)
     except Exception as e:
         print(f"Warning: could not prepare local ledit binary: {e}")
+    return test_dir
+
+def _report_result(test_file, returncode, timed_out, log_path, show_log):
+    """Print the outcome of one test, with the tail of its log on failure if show_log"""
+    if timed_out:
+        print(f"❌ TIMEOUT: {test_file.stem}")
+        return 1
+
+    print("\n" + "-" * 50)
+    if returncode == 0:
+        print(f"✅ PASSED: {test_file.stem}")
+    else:
+        print(f"❌ FAILED: {test_file.stem}")
+        if show_log:
+            with open(log_path, errors="replace") as log:
+                tail = deque(log, maxlen=LOG_TAIL_LINES)
+            print(f"\nTest output (last {LOG_TAIL_LINES} lines):")
+            print("".join(tail), end="")
+    return returncode
+
+def _kill_test_group(proc):
+    """SIGKILL a test's whole process group; returns False if it was already gone.
+
+    Tests run in their own session, so a Ctrl-C to the runner does not reach them
+    and background children can outlive the test's bash.
+    """
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        return False
+    return True
+
+def run_single_test(script_dir, test_file, model, stream=False, timeout=TEST_TIMEOUT, env=None):
+    """Run a single test against the prebuilt ledit binary and return exit code.
+
+    Output is written to a per-test log; with stream=True it is also echoed live.
+    """
+    script_dir = Path(script_dir)
+    test_file = Path(test_file)
+    test_dir = _prepare_test_dir(script_dir, test_file)
 
     # Run the test
-    env = os.environ.copy()
-    env["PATH"] = f"{script_dir}:{env.get('PATH', '')}"
-    
+    if env is None:
+        env = build_test_env(script_dir)
+
+    log_path = test_dir / "output.log"
+    timed_out = threading.Event()
+    proc = None
+
+    def kill_on_timeout():
+        # Kill the whole process group, even if bash already exited, so children
+        # holding the pipe open die too
+        if _kill_test_group(proc):
+            timed_out.set()
+
     try:
-        result = subprocess.run(
-            ["bash", str(test_file), model],
-            cwd=str(test_dir),
-            capture_output=True,
-            text=True,
-            timeout=600,  # 10 minute timeout for e2e tests
-            env=env
-        )
-        
-        # Print result
-        print("\n" + "-" * 50)
-        if result.returncode == 0:
-            print(f"✅ PASSED: {test_file.stem}")
-        else:
-            print(f"❌ FAILED: {test_file.stem}")
-            print("\nTest output:")
-            print(result.stdout)
-            if result.stderr:
-                print("\nError output:")
-                print(result.stderr)
-        
-        return result.returncode
+        # Merge stderr into stdout and send it to a log file so memory stays flat
+        # regardless of how much the test prints. Unless the output is streamed,
+        # the child writes the log directly and Python only reads it on failure.
+        with open(log_path, "w") as log:
+            proc = subprocess.Popen(
+                [*BASH, str(test_file), model],
+                cwd=str(test_dir),
+                stdout=subprocess.PIPE if stream else log,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                env=env,
+                start_new_session=True,
+            )
+            timer = threading.Timer(timeout, kill_on_timeout)
+            timer.start()
+            try:
+                if stream:
+                    for line in proc.stdout:
+                        log.write(line)
+                        print(line, end="", flush=True)
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+
+        return _report_result(test_file, returncode, timed_out.is_set(), log_path, show_log=not stream)
         
-    except subprocess.TimeoutExpired:
-        print(f"❌ TIMEOUT: {test_file.stem}")
-        return 1
     finally:
-        # Cleanup
-        import shutil
-        if test_dir.parent.exists():
-            shutil.rmtree(test_dir.parent, ignore_errors=True)
+        # Don't leave the test running (e.g. after Ctrl-C) once its workdir is gone
+        if proc is not None:
+            _kill_test_group(proc)
+        # Cleanup only this test's directory
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+async def _run_one_async(script_dir, test_file, model, timeout, env):
+    """asyncio counterpart of _run_one: returns (name, exit_code, buffered output)"""
+    test_dir = _prepare_test_dir(script_dir, test_file)
+    log_path = test_dir / "output.log"
+    timed_out = False
+    proc = None
+    try:
+        with open(log_path, "wb") as log:
+            proc = await asyncio.create_subprocess_exec(
+                *BASH, str(test_file), model,
+                cwd=str(test_dir),
+                stdout=log,
+                stderr=asyncio.subprocess.STDOUT,
+                env=env,
+                start_new_session=True,
+            )
+            try:
+                returncode = await asyncio.wait_for(proc.wait(), timeout)
+            except asyncio.TimeoutError:
+                timed_out = _kill_test_group(proc)
+                returncode = await proc.wait()
+
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            exit_code = _report_result(test_file, returncode, timed_out, log_path, show_log=True)
+        return test_file.stem, exit_code, buf.getvalue()
+    finally:
+        # Cancellation (e.g. Ctrl-C) must not leave the test running without its workdir
+        if proc is not None:
+            _kill_test_group(proc)
+        shutil.rmtree(test_dir, ignore_errors=True)
+
+async def _run_all_async(script_dir, tests, model, jobs, deadline_at, suite, on_result):
+    """Supervise all tests from one event loop, at most `jobs` at a time"""
+    sem = asyncio.Semaphore(jobs)
+    env = build_test_env(script_dir, jobs)
+
+    async def run_one(test_file):
+        async with sem:
+            timeout = _time_left(suite.test_timeout, deadline_at)
+            if timeout <= 0:
+                return test_file.stem, None, ""
+            return await _run_one_async(script_dir, test_file, model, timeout, env)
 
-def run_all_tests(script_dir, tests, model):
-    """Run all tests and print summary"""
+    for coro in asyncio.as_completed([run_one(t) for t in tests]):
+        on_result(*await coro)
+
+def _time_left(test_timeout, deadline_at):
+    """Seconds left for the next test: test_timeout, capped by the run deadline if any"""
+    if deadline_at is None:
+        return test_timeout
+    return min(test_timeout, deadline_at - time.monotonic())
+
+def _result_status(exit_code):
+    if exit_code is None:
+        return "SKIP"
+    return "PASS" if exit_code == 0 else "FAIL"
+
+# Per-worker state, set once by _worker_init so tasks only need to send an index
+_WORKER_SCRIPT_DIR = None
+_WORKER_TESTS = ()
+_WORKER_MODEL = None
+_WORKER_TIMEOUT = TEST_TIMEOUT
+_WORKER_DEADLINE = None
+_WORKER_ENV = None
+
+def _worker_init(script_dir, tests, model, test_timeout, deadline_at, jobs):
+    """Worker initializer: receive the discovered test list and model once per process"""
+    global _WORKER_SCRIPT_DIR, _WORKER_TESTS, _WORKER_MODEL, _WORKER_TIMEOUT, _WORKER_DEADLINE, _WORKER_ENV
+    _WORKER_SCRIPT_DIR = Path(script_dir)
+    _WORKER_ENV = build_test_env(script_dir, jobs)
+    _WORKER_TESTS = tuple(Path(t) for t in tests)
+    _WORKER_MODEL = model
+    _WORKER_TIMEOUT = test_timeout
+    # time.monotonic() is a system-wide clock, so the parent's deadline is valid here
+    _WORKER_DEADLINE = deadline_at
+
+def _run_one(index):
+    """Worker: run one test, buffering its output so results don't interleave.
+
+    Returns an exit code of None if the run deadline passed before the test started.
+    """
+    test_file = _WORKER_TESTS[index]
+    timeout = _time_left(_WORKER_TIMEOUT, _WORKER_DEADLINE)
+    if timeout <= 0:
+        return test_file.stem, None, ""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        exit_code = run_single_test(_WORKER_SCRIPT_DIR, test_file, _WORKER_MODEL,
+                                    timeout=timeout, env=_WORKER_ENV)
+    return test_file.stem, exit_code, buf.getvalue()
+
+def run_all_tests(script_dir, tests, model, jobs=1, deadline=None, suite=E2E_SUITE, use_async=False):
+    """Run all tests, up to `jobs` at a time, and print summary.
+
+    If `deadline` (seconds) is given, no test runs past it: running tests are
+    killed when it expires and tests that have not started are skipped.
+    With use_async, tests are supervised from a single asyncio event loop
+    instead of a pool of worker processes.
+    """
+    script_dir = Path(script_dir)
     results = {}
+    deadline_at = time.monotonic() + deadline if deadline is not None else None
+
+    def on_result(name, exit_code, output):
+        results[name] = _result_status(exit_code)
+        if exit_code is None:
+            return
+        print(f"\n[{len(results)}/{len(tests)}] Finished: {name}")
+        print(output, end="", flush=True)
+
+    if use_async:
+        print(f"Running {len(tests)} tests with {jobs} concurrent jobs (asyncio)")
+        asyncio.run(_run_all_async(script_dir, tests, model, jobs, deadline_at, suite, on_result))
+    elif jobs == 1:
+        env = build_test_env(script_dir)
+        for i, test_file in enumerate(tests, 1):
+            timeout = _time_left(suite.test_timeout, deadline_at)
+            if timeout <= 0:
+                results[test_file.stem] = "SKIP"
+                continue
+            print(f"\n[{i}/{len(tests)}] Running: {test_file.stem}")
+            exit_code = run_single_test(script_dir, test_file, model, stream=True,
+                                        timeout=timeout, env=env)
+            results[test_file.stem] = _result_status(exit_code)
+    else:
+        print(f"Running {len(tests)} tests with {jobs} parallel jobs")
+        initargs = (str(script_dir), [str(t) for t in tests], model, suite.test_timeout, deadline_at, jobs)
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_worker_init, initargs=initargs) as executor:
+            futures = [executor.submit(_run_one, i) for i in range(len(tests))]
+            for future in as_completed(futures):
+                on_result(*future.result())
     
-    for i, test_file in enumerate(tests, 1):
-        print(f"\n[{i}/{len(tests)}] Running: {test_file.stem}")
-        exit_code = run_single_test(script_dir, test_file, model)
-        results[test_file.stem] = "PASS" if exit_code == 0 else "FAIL"
-    
-    # Print summary
-    print("\n" + "=" * 60)
-    print("E2E TEST RESULTS SUMMARY")
-    print("=" * 60)
-    
+    # Print summary as a single write
     passed = sum(1 for r in results.values() if r == "PASS")
     failed = sum(1 for r in results.values() if r == "FAIL")
-    
-    for test_name, result in results.items():
-        status = "✅ PASS" if result == "PASS" else "❌ FAIL"
-        print(f"{status}: {test_name}")
-    
-    print(f"\nTotal: {passed} passed, {failed} failed out of {len(tests)} tests")
-    sys.exit(0 if failed == 0 else 1)
+    skipped = sum(1 for r in results.values() if r == "SKIP")
+
+    status_labels = {"PASS": "✅ PASS", "FAIL": "❌ FAIL", "SKIP": "⏭️  SKIP"}
+    out = ["\n" + "=" * 60, f"{suite.name.upper()} TEST RESULTS SUMMARY", "=" * 60]
+    out += [f"{status_labels[results[t.stem]]}: {t.stem}" for t in tests]
+
+    total = f"\nTotal: {passed} passed, {failed} failed"
+    if skipped:
+        total += f", {skipped} skipped (deadline reached)"
+    out.append(f"{total} out of {len(tests)} tests")
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
+    sys.exit(0 if failed == 0 and skipped == 0 else 1)
 
 if __name__ == "__main__":
     main()
@@ -20,6 +20,8 @@ import argparse
 import json
 import pathlib
 import re
+import shlex
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -35,12 +37,16 @@ _TODO_RE = re.compile(r"^\[\]\s+[-—]\s+(.+)$")
 PLACEHOLDER = "{TODO_TEXT}"
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoItem:
     line_idx: int
     text: str
 
 
+# Parsed TODO files keyed by path, as ((st_mtime_ns, st_size), items)
+_parse_cache: dict[pathlib.Path, tuple[tuple[int, int], list[TodoItem]]] = {}
+
+
 @dataclass
 class Opts:
     repo: pathlib.Path
@@ -72,17 +78,29 @@ def _log(msg: str) -> None:
 
 
 def parse_incomplete_todos(todo_path: pathlib.Path) -> list[TodoItem]:
-    """Return all incomplete ``[]`` items from *todo_path*."""
+    """Return all incomplete ``[]`` items from *todo_path*.
+
+    The file is only re-parsed when its mtime or size has changed since the
+    last call.
+    """
     items: list[TodoItem] = []
-    if not todo_path.exists():
-        raise FileNotFoundError(f"TODO file not found: {todo_path}")
+    try:
+        st = todo_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"TODO file not found: {todo_path}") from None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _parse_cache.get(todo_path)
+    if cached is not None and cached[0] == key:
+        return list(cached[1])
+
     lines = todo_path.read_text(encoding="utf-8").splitlines()
     for idx, line in enumerate(lines):
         line = line.strip()
         m = _TODO_RE.match(line)
         if m:
             items.append(TodoItem(line_idx=idx, text=m.group(1).strip()))
-    return items
+    _parse_cache[todo_path] = (key, items)
+    return list(items)
 
 
 def mark_todo_complete(todo_path: pathlib.Path, todo_text: str) -> None:
@@ -225,7 +243,7 @@ def run_ledit_agent(
         "--no-web-ui",
         "--no-connection-check",
     ]
-    _log(f"Running: {' '.join(cmd)}")
+    _log(f"Running: {shlex.join(cmd)}")
     if opts.dry_run:
         _log("[DRY RUN] Would run ledit agent (skipped)")
         return subprocess.CompletedProcess(cmd, returncode=0, stdout="", stderr="")
@@ -258,7 +276,7 @@ def run_ledit_commit(opts: Opts) -> subprocess.CompletedProcess[str]:
         )
 
     cmd = [opts.ledit_bin, "commit", "--skip-prompt"]
-    _log(f"Running: {' '.join(cmd)}")
+    _log(f"Running: {shlex.join(cmd)}")
     if opts.dry_run:
         _log("[DRY RUN] Would run ledit commit (skipped)")
         return subprocess.CompletedProcess(cmd, returncode=0, stdout="", stderr="")
@@ -421,11 +439,16 @@ def main() -> None:
     todo_file = pathlib.Path(args.todo_file) if args.todo_file else repo / "TODO.md"
     workflow_config = pathlib.Path(args.workflow_config).expanduser().resolve()
 
+    # Resolve a bare command name through PATH once rather than on every spawn
+    ledit_bin = args.ledit_bin
+    if "/" not in ledit_bin:
+        ledit_bin = shutil.which(ledit_bin) or ledit_bin
+
     opts = Opts(
         repo=repo,
         todo_file=todo_file,
         workflow_config=workflow_config,
-        ledit_bin=args.ledit_bin,
+        ledit_bin=ledit_bin,
         max_todos=args.max_todos,
         single=args.single,
         dry_run=args.dry_run,